@@ -1,38 +1,77 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from ... import crud, schemas
 from ...database import get_db
+from ...schema import TodoCreateInput, TodoSort
 
 router = APIRouter()
 
+def _bulk_response(result) -> dict:
+    rows, errors = result
+    return {"todos": rows, "errors": [error._asdict() for error in errors]}
+
 @router.post("/", response_model=schemas.Todo)
 def create_todo(todo: schemas.TodoCreate, db: Session = Depends(get_db)):
-    return crud.create_todo(db=db, todo=todo)
+    return crud.create_todo(db, TodoCreateInput(title=todo.title, urgency=todo.urgency))
+
+@router.post("/batch", response_model=schemas.BulkTodoResult)
+def create_todos(todos: List[schemas.TodoCreate], db: Session = Depends(get_db)):
+    todo_inputs = [TodoCreateInput(title=todo.title, urgency=todo.urgency) for todo in todos]
+    try:
+        return _bulk_response(crud.create_todos(db, todo_inputs))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.patch("/batch", response_model=schemas.BulkTodoResult)
+def update_todos(todos: List[schemas.TodoBulkUpdate], db: Session = Depends(get_db)):
+    try:
+        return _bulk_response(crud.update_todos(db, todos))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+@router.post("/batch/delete", response_model=schemas.BulkTodoResult)
+def delete_todos(request: schemas.TodoBulkDelete, db: Session = Depends(get_db)):
+    try:
+        return _bulk_response(crud.delete_todos(db, request.ids))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 @router.get("/", response_model=List[schemas.Todo])
-def read_todos(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    todos = crud.get_todos(db, skip=skip, limit=limit)
+def read_todos(
+    response: Response,
+    limit: int = crud.MAX_PAGE_SIZE,
+    after: Optional[str] = None,
+    sort: TodoSort = TodoSort.CREATED_AT,
+    db: Session = Depends(get_db),
+):
+    """Keyset-paginated list; the cursor for the next page is sent in X-Next-Cursor."""
+    try:
+        todos, cursors, has_next_page = crud.get_todos_page(db, first=limit, after=after, sort=sort)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if has_next_page:
+        response.headers["X-Next-Cursor"] = cursors[-1]
     return todos
 
 @router.get("/{todo_id}", response_model=schemas.Todo)
 def read_todo(todo_id: int, db: Session = Depends(get_db)):
-    db_todo = crud.get_todo(db, todo_id=todo_id)
+    db_todo = crud.get_todo(db, todo_id)
     if db_todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     return db_todo
 
 @router.put("/{todo_id}", response_model=schemas.Todo)
 def update_todo(todo_id: int, todo: schemas.TodoUpdate, db: Session = Depends(get_db)):
-    db_todo = crud.update_todo(db, todo_id=todo_id, todo=todo)
+    db_todo = crud.update_todo(db, todo_id, todo)
     if db_todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     return db_todo
 
 @router.delete("/{todo_id}", response_model=schemas.Todo)
 def delete_todo(todo_id: int, db: Session = Depends(get_db)):
-    db_todo = crud.delete_todo(db, todo_id=todo_id)
+    db_todo = crud.delete_todo(db, todo_id)
     if db_todo is None:
         raise HTTPException(status_code=404, detail="Todo not found")
     return db_todo 
\ No newline at end of file
@@ -1,14 +1,80 @@
+import base64
+import binascii
+import json
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import String, bindparam, delete, insert, literal, select, tuple_, type_coerce, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from . import models
-from .schema import TodoCreateInput, TodoUpdateInput
+from .schema import TodoCreateInput, TodoUpdateInput, TodoSort
 from . import ai_service
 
+MAX_PAGE_SIZE = 100
+MAX_BULK_ITEMS = 500
+# Rows per multi-row INSERT; 3 bound parameters per row keeps each statement
+# under SQLite's default limit of 999 host parameters.
+BULK_INSERT_CHUNK = 300
+
+# Keyset columns for each sort order; every page is ORDER BY <column> DESC, id DESC
+# and is served by the matching (<column>, id) index on models.Todo.
+SORT_COLUMNS = {
+    TodoSort.CREATED_AT: models.Todo.created_at,
+    TodoSort.URGENCY: models.Todo.urgency,
+}
+
 def get_todo(db: Session, todo_id: int):
     return db.query(models.Todo).filter(models.Todo.id == todo_id).first()
 
 def get_todos(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.Todo).offset(skip).limit(limit).all()
 
+def encode_cursor(sort_value, todo_id: int) -> str:
+    """Build an opaque cursor from a row's sort key and id."""
+    payload = json.dumps([sort_value, todo_id], default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor: str):
+    """Inverse of encode_cursor. Raises ValueError for malformed cursors."""
+    try:
+        sort_value, todo_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(todo_id, int) or not isinstance(sort_value, (int, str, type(None))):
+        raise ValueError("Invalid cursor")
+    return sort_value, todo_id
+
+def get_todos_page(
+    db: Session,
+    first: int = 20,
+    after: Optional[str] = None,
+    sort: TodoSort = TodoSort.CREATED_AT,
+) -> Tuple[List[models.Todo], List[str], bool]:
+    """
+    Return one keyset page of todos as (todos, cursors, has_next_page).
+
+    Rows are ordered by the sort column descending with id as tiebreaker, and
+    `after` resumes strictly after the row the cursor was issued for, so the
+    cost of a page does not depend on how deep into the list it is.
+    """
+    first = max(1, min(first, MAX_PAGE_SIZE))
+    column = SORT_COLUMNS[sort]
+    # The raw stored value goes into the cursor so the comparison below
+    # matches it exactly (SQLite stores timestamps as text).
+    sort_key = type_coerce(column, String).label("sort_key")
+
+    query = db.query(models.Todo, sort_key)
+    if after is not None:
+        sort_value, last_id = decode_cursor(after)
+        query = query.filter(tuple_(column, models.Todo.id) < tuple_(literal(sort_value), literal(last_id)))
+    rows = query.order_by(column.desc(), models.Todo.id.desc()).limit(first + 1).all()
+
+    has_next_page = len(rows) > first
+    rows = rows[:first]
+    todos = [todo for todo, _ in rows]
+    cursors = [encode_cursor(key, todo.id) for todo, key in rows]
+    return todos, cursors, has_next_page
+
 def create_todo(db: Session, todo_input: TodoCreateInput):
     db_todo = models.Todo(
         title=todo_input.title,
@@ -39,6 +105,110 @@ def delete_todo(db: Session, todo_id: int):
         db.commit()
     return db_todo
 
+class BulkError(NamedTuple):
+    """A rejected item of a bulk operation, by position in the request."""
+    index: int
+    id: Optional[int]
+    message: str
+
+def _check_bulk_size(items: Sequence) -> None:
+    if len(items) > MAX_BULK_ITEMS:
+        raise ValueError(f"At most {MAX_BULK_ITEMS} items per batch")
+
+def _select_todo_rows(db: Session, *criteria):
+    """Plain rows (no ORM identity map) for the todos matching criteria."""
+    table = models.Todo.__table__
+    return db.execute(select(table).where(*criteria).order_by(table.c.id)).all()
+
+def create_todos(db: Session, todo_inputs: Sequence[TodoCreateInput]) -> Tuple[list, List[BulkError]]:
+    """
+    Insert many todos in one transaction and return (created rows, errors).
+
+    Invalid items are reported and skipped; the rest are written with
+    multi-row INSERTs and a single commit, then read back with one SELECT.
+    """
+    _check_bulk_size(todo_inputs)
+    errors, values = [], []
+    for index, todo_input in enumerate(todo_inputs):
+        if not todo_input.title or not todo_input.title.strip():
+            errors.append(BulkError(index, None, "Title must not be empty"))
+            continue
+        values.append({"title": todo_input.title, "urgency": todo_input.urgency, "completed": False})
+    if not values:
+        return [], errors
+
+    first_id = last_id = None
+    for start in range(0, len(values), BULK_INSERT_CHUNK):
+        chunk = values[start:start + BULK_INSERT_CHUNK]
+        result = db.execute(insert(models.Todo.__table__).values(chunk))
+        # SQLite hands out rowid = max(rowid) + 1 per row, and the write lock
+        # is held until commit, so the whole batch occupies one id range.
+        last_id = result.lastrowid
+        if first_id is None:
+            first_id = last_id - len(chunk) + 1
+    db.commit()
+    return _select_todo_rows(db, models.Todo.id.between(first_id, last_id)), errors
+
+def update_todos(db: Session, todo_inputs: Sequence) -> Tuple[list, List[BulkError]]:
+    """
+    Apply many partial updates in one transaction and return (updated rows, errors).
+
+    Each input carries an `id` plus the optional TodoUpdateInput fields.
+    Updates touching the same set of columns are sent as one executemany.
+    """
+    _check_bulk_size(todo_inputs)
+    requested_ids = {todo_input.id for todo_input in todo_inputs}
+    existing_ids = set(db.execute(select(models.Todo.id).where(models.Todo.id.in_(requested_ids))).scalars())
+
+    errors, groups = [], {}
+    for index, todo_input in enumerate(todo_inputs):
+        if todo_input.id not in existing_ids:
+            errors.append(BulkError(index, todo_input.id, "Todo not found"))
+            continue
+        if todo_input.title is not None and not todo_input.title.strip():
+            errors.append(BulkError(index, todo_input.id, "Title must not be empty"))
+            continue
+        changes = {
+            field: getattr(todo_input, field)
+            for field in ("title", "completed", "urgency")
+            if getattr(todo_input, field) is not None
+        }
+        groups.setdefault(tuple(sorted(changes)), []).append(
+            {"todo_id": todo_input.id, **{f"new_{field}": value for field, value in changes.items()}}
+        )
+
+    updated_ids = set()
+    table = models.Todo.__table__
+    for fields, params in groups.items():
+        updated_ids.update(param["todo_id"] for param in params)
+        if not fields:
+            continue
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("todo_id"))
+            .values({field: bindparam(f"new_{field}") for field in fields})
+        )
+        db.execute(statement, params)
+    db.commit()
+    if not updated_ids:
+        return [], errors
+    return _select_todo_rows(db, models.Todo.id.in_(updated_ids)), errors
+
+def delete_todos(db: Session, todo_ids: Sequence[int]) -> Tuple[list, List[BulkError]]:
+    """Delete many todos with one DELETE and return (deleted rows, errors)."""
+    _check_bulk_size(todo_ids)
+    rows = _select_todo_rows(db, models.Todo.id.in_(set(todo_ids)))
+    found_ids = {row.id for row in rows}
+    errors = [
+        BulkError(index, todo_id, "Todo not found")
+        for index, todo_id in enumerate(todo_ids)
+        if todo_id not in found_ids
+    ]
+    if found_ids:
+        db.execute(delete(models.Todo.__table__).where(models.Todo.id.in_(found_ids)))
+        db.commit()
+    return rows, errors
+
 def generate_todo(db: Session) -> models.Todo:
     # Get all existing todos
     todos = get_todos(db)
@@ -64,4 +234,46 @@ def delete_completed_todos(db: Session):
     """Delete all completed todos from the database."""
     deleted_count = db.query(models.Todo).filter(models.Todo.completed == True).delete()
     db.commit()
-    return deleted_count 
\ No newline at end of file
+    return deleted_count
+
+# Async variants for the GraphQL resolvers. Each one runs the sync
+# implementation above through AsyncSession.run_sync, so the statements go
+# through aiosqlite without blocking the event loop while the query logic
+# stays in one place.
+async def get_todo_async(db: AsyncSession, todo_id: int):
+    return await db.run_sync(get_todo, todo_id)
+
+async def get_todos_async(db: AsyncSession, skip: int = 0, limit: int = 100):
+    return await db.run_sync(get_todos, skip, limit)
+
+async def get_todos_page_async(
+    db: AsyncSession,
+    first: int = 20,
+    after: Optional[str] = None,
+    sort: TodoSort = TodoSort.CREATED_AT,
+):
+    return await db.run_sync(get_todos_page, first, after, sort)
+
+async def create_todo_async(db: AsyncSession, todo_input: TodoCreateInput):
+    return await db.run_sync(create_todo, todo_input)
+
+async def update_todo_async(db: AsyncSession, todo_id: int, todo_input: TodoUpdateInput):
+    return await db.run_sync(update_todo, todo_id, todo_input)
+
+async def delete_todo_async(db: AsyncSession, todo_id: int):
+    return await db.run_sync(delete_todo, todo_id)
+
+async def create_todos_async(db: AsyncSession, todo_inputs: Sequence[TodoCreateInput]):
+    return await db.run_sync(create_todos, todo_inputs)
+
+async def update_todos_async(db: AsyncSession, todo_inputs: Sequence):
+    return await db.run_sync(update_todos, todo_inputs)
+
+async def delete_todos_async(db: AsyncSession, todo_ids: Sequence[int]):
+    return await db.run_sync(delete_todos, todo_ids)
+
+async def delete_all_todos_async(db: AsyncSession):
+    return await db.run_sync(delete_all_todos)
+
+async def delete_completed_todos_async(db: AsyncSession):
+    return await db.run_sync(delete_completed_todos)
@@ -1,13 +1,100 @@
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./todos.db"
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./todos.db")
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# PRAGMAs applied to every new SQLite connection. WAL lets readers proceed
+# while a writer commits; synchronous=NORMAL is durable across application
+# crashes in WAL mode and skips the fsync on every commit.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-64000"),  # negative = KiB, i.e. 64 MB
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", "268435456"),  # 256 MB
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+    "busy_timeout": os.getenv("DB_BUSY_TIMEOUT", "5000"),  # milliseconds
+}
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync database URL to the matching asyncio driver."""
+    parsed = make_url(url)
+    drivers = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+    driver = drivers.get(parsed.get_backend_name())
+    if driver is None or parsed.get_driver_name() == driver:
+        return str(parsed)
+    return str(parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}"))
+
+
+def _engine_options(url: str, pool_class) -> dict:
+    """Engine keyword arguments for url, sized from the environment."""
+    parsed = make_url(url)
+    options = {}
+    if is_sqlite(url):
+        options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:"):
+            # Every pooled connection would get its own private in-memory
+            # database, so keep SQLAlchemy's single-connection default.
+            return options
+    options.update(
+        poolclass=pool_class,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_pre_ping=False,
+    )
+    return options
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, **overrides):
+    """Create the sync engine for url with pool sizing and SQLite PRAGMAs."""
+    engine = create_engine(url, **{**_engine_options(url, QueuePool), **overrides})
+    if is_sqlite(url):
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+def create_async_db_engine(url: str = SQLALCHEMY_DATABASE_URL, **overrides):
+    """Create the asyncio engine for url, configured like create_db_engine."""
+    url = to_async_url(url)
+    engine = create_async_engine(url, **{**_engine_options(url, AsyncAdaptedQueuePool), **overrides})
+    if is_sqlite(url):
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine used by the GraphQL resolvers. aiosqlite runs the sqlite3
+# calls on its own thread, so a slow commit no longer stalls the event loop.
+async_engine = create_async_db_engine()
+AsyncSessionLocal = sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 # Dependency
@@ -16,4 +103,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+# Async dependency
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
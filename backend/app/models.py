@@ -1,13 +1,18 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from .database import Base
 
 class Todo(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY <sort column> DESC, id DESC
+        Index("ix_todos_created_at_id", "created_at", "id"),
+        Index("ix_todos_urgency_id", "urgency", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     completed = Column(Boolean, default=False)
     urgency = Column(Integer, default=0)  # 0=none, 1=low, 2=medium, 3=high
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now()) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,9 +1,11 @@
 import strawberry
+from enum import Enum
 from typing import List, Optional
 from datetime import datetime, timezone
 from . import models, crud, ai_service
-from sqlalchemy.orm import Session
-from .database import get_db
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from .database import get_async_db
 from strawberry.types import Info
 
 @strawberry.type
@@ -35,6 +37,37 @@ class Todo:
         self.createdAt = createdAt.replace(tzinfo=timezone.utc) if createdAt and createdAt.tzinfo is None else createdAt
         self.updatedAt = updatedAt.replace(tzinfo=timezone.utc) if updatedAt and updatedAt.tzinfo is None else updatedAt
 
+    @classmethod
+    def from_db_model(cls, todo: models.Todo) -> "Todo":
+        return cls(
+            id=todo.id,
+            title=todo.title,
+            completed=todo.completed,
+            urgency=todo.urgency,
+            createdAt=todo.created_at,
+            updatedAt=todo.updated_at
+        )
+
+@strawberry.enum
+class TodoSort(Enum):
+    CREATED_AT = "created_at"  # newest first
+    URGENCY = "urgency"  # most urgent first
+
+@strawberry.type
+class PageInfo:
+    hasNextPage: bool
+    endCursor: Optional[str] = None
+
+@strawberry.type
+class TodoEdge:
+    cursor: str
+    node: Todo
+
+@strawberry.type
+class TodoConnection:
+    edges: List[TodoEdge]
+    pageInfo: PageInfo
+
 @strawberry.input
 class TodoCreateInput:
     title: str
@@ -58,34 +91,63 @@ class TodoUpdateInput:
     completed: Optional[bool] = None
     urgency: Optional[int] = None
 
+@strawberry.input
+class TodoBulkUpdateInput:
+    id: int
+    title: Optional[str] = None
+    completed: Optional[bool] = None
+    urgency: Optional[int] = None
+
+@strawberry.type
+class BulkItemError:
+    index: int  # position of the rejected item in the request list
+    id: Optional[int]
+    message: str
+
+@strawberry.type
+class BulkTodoResult:
+    todos: List[Todo]
+    errors: List[BulkItemError]
+
+    @classmethod
+    def from_crud(cls, result) -> "BulkTodoResult":
+        rows, errors = result
+        return cls(
+            todos=[Todo.from_db_model(row) for row in rows],
+            errors=[BulkItemError(index=error.index, id=error.id, message=error.message) for error in errors],
+        )
+
 @strawberry.type
 class Query:
     @strawberry.field
     async def todos(self, info) -> List[Todo]:
         db = info.context["db"]
-        todos = crud.get_todos(db)
-        return [Todo(
-            id=todo.id,
-            title=todo.title,
-            completed=todo.completed,
-            urgency=todo.urgency,
-            createdAt=todo.created_at,
-            updatedAt=todo.updated_at
-        ) for todo in todos]
+        todos = await crud.get_todos_async(db)
+        return [Todo.from_db_model(todo) for todo in todos]
+
+    @strawberry.field
+    async def todos_connection(
+        self,
+        info,
+        first: int = 20,
+        after: Optional[str] = None,
+        sort: TodoSort = TodoSort.CREATED_AT,
+    ) -> TodoConnection:
+        """Relay-style cursor pagination over all todos."""
+        db = info.context["db"]
+        todos, cursors, has_next_page = await crud.get_todos_page_async(db, first, after, sort)
+        edges = [TodoEdge(cursor=cursor, node=Todo.from_db_model(todo)) for todo, cursor in zip(todos, cursors)]
+        return TodoConnection(
+            edges=edges,
+            pageInfo=PageInfo(hasNextPage=has_next_page, endCursor=cursors[-1] if cursors else None),
+        )
 
     @strawberry.field
     async def todo(self, info, id: int) -> Optional[Todo]:
         db = info.context["db"]
-        todo = crud.get_todo(db, id)
+        todo = await crud.get_todo_async(db, id)
         if todo:
-            return Todo(
-                id=todo.id,
-                title=todo.title,
-                completed=todo.completed,
-                urgency=todo.urgency,
-                createdAt=todo.created_at,
-                updatedAt=todo.updated_at
-            )
+            return Todo.from_db_model(todo)
         return None
 
 @strawberry.type
@@ -101,15 +163,8 @@ class Mutation:
     @strawberry.mutation
     async def create_todo(self, info, input: TodoCreateInput) -> Todo:
         db = info.context["db"]
-        created_todo = crud.create_todo(db, input)
-        return Todo(
-            id=created_todo.id,
-            title=created_todo.title,
-            completed=created_todo.completed,
-            urgency=created_todo.urgency,
-            createdAt=created_todo.created_at,
-            updatedAt=created_todo.updated_at
-        )
+        created_todo = await crud.create_todo_async(db, input)
+        return Todo.from_db_model(created_todo)
 
     @strawberry.mutation
     async def generate_todo_suggestion(self, info, existing_todos: List[str], urgency: int) -> TodoSuggestionResponse:
@@ -120,52 +175,52 @@ class Mutation:
     @strawberry.mutation
     async def update_todo(self, info, id: int, input: TodoUpdateInput) -> Optional[Todo]:
         db = info.context["db"]
-        updated_todo = crud.update_todo(db, id, input)
+        updated_todo = await crud.update_todo_async(db, id, input)
         if updated_todo:
-            return Todo(
-                id=updated_todo.id,
-                title=updated_todo.title,
-                completed=updated_todo.completed,
-                urgency=updated_todo.urgency,
-                createdAt=updated_todo.created_at,
-                updatedAt=updated_todo.updated_at
-            )
+            return Todo.from_db_model(updated_todo)
         return None
 
     @strawberry.mutation
     async def delete_todo(self, info, id: int) -> Optional[Todo]:
         db = info.context["db"]
-        deleted_todo = crud.delete_todo(db, id)
+        deleted_todo = await crud.delete_todo_async(db, id)
         if deleted_todo:
-            return Todo(
-                id=deleted_todo.id,
-                title=deleted_todo.title,
-                completed=deleted_todo.completed,
-                urgency=deleted_todo.urgency,
-                createdAt=deleted_todo.created_at,
-                updatedAt=deleted_todo.updated_at
-            )
+            return Todo.from_db_model(deleted_todo)
         return None
 
+    @strawberry.mutation
+    async def create_todos(self, info, inputs: List[TodoCreateInput]) -> BulkTodoResult:
+        """Create many todos in a single transaction."""
+        db = info.context["db"]
+        return BulkTodoResult.from_crud(await crud.create_todos_async(db, inputs))
+
+    @strawberry.mutation
+    async def update_todos(self, info, inputs: List[TodoBulkUpdateInput]) -> BulkTodoResult:
+        """Update many todos in a single transaction."""
+        db = info.context["db"]
+        return BulkTodoResult.from_crud(await crud.update_todos_async(db, inputs))
+
+    @strawberry.mutation
+    async def delete_todos(self, info, ids: List[int]) -> BulkTodoResult:
+        """Delete many todos in a single transaction."""
+        db = info.context["db"]
+        return BulkTodoResult.from_crud(await crud.delete_todos_async(db, ids))
+
     @strawberry.mutation
     async def delete_all_todos(self, info: Info) -> DeleteResponse:
         """Delete all todos."""
         db = info.context["db"]
-        deleted_count = crud.delete_all_todos(db)
+        deleted_count = await crud.delete_all_todos_async(db)
         return DeleteResponse(success=deleted_count > 0)
 
     @strawberry.mutation
     async def delete_completed_todos(self, info: Info) -> DeleteResponse:
         """Delete all completed todos."""
         db = info.context["db"]
-        deleted_count = crud.delete_completed_todos(db)
+        deleted_count = await crud.delete_completed_todos_async(db)
         return DeleteResponse(success=deleted_count > 0)
 
-async def get_context():
-    db = next(get_db())
-    try:
-        yield {"db": db}
-    finally:
-        db.close()
+async def get_context(db: AsyncSession = Depends(get_async_db)):
+    return {"db": db}
 
 schema = strawberry.Schema(query=Query, mutation=Mutation) 
\ No newline at end of file
@@ -1,25 +1,42 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class TodoBase(BaseModel):
     title: str
     description: Optional[str] = None
 
 class TodoCreate(TodoBase):
-    pass
+    urgency: Optional[int] = 1
 
 class TodoUpdate(TodoBase):
     title: Optional[str] = None
     description: Optional[str] = None
     completed: Optional[bool] = None
+    urgency: Optional[int] = None
+
+class TodoBulkUpdate(TodoUpdate):
+    id: int
+
+class TodoBulkDelete(BaseModel):
+    ids: List[int]
 
 class Todo(TodoBase):
     id: int
     completed: bool
+    urgency: Optional[int] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     class Config:
         orm_mode = True
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    message: str
+
+class BulkTodoResult(BaseModel):
+    todos: List[Todo]
+    errors: List[BulkItemError]
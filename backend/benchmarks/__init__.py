@@ -0,0 +1,2 @@
+# Performance benchmarks for the backend. Each module can be run directly,
+# e.g. `python -m benchmarks.bench_async_reads`, from the backend directory.
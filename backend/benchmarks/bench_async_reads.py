@@ -0,0 +1,103 @@
+"""
+Read latency under concurrent writes: sync vs async database access.
+
+Reads arrive at a fixed rate while writers keep creating rows. In "sync" mode every
+call runs the blocking crud functions directly on the event loop, which is
+how the resolvers used to work; in "async" mode they go through the
+aiosqlite-backed AsyncSession variants. The p99 read latency shows how much
+a commit in flight delays unrelated requests.
+
+Usage: python -m benchmarks.bench_async_reads [--read-rate 50] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+from app.schema import TodoCreateInput
+
+from .common import summarize, temp_database_path
+
+
+async def _run(mode: str, path: str, read_rate: float, writers: int, seconds: float, seed_rows: int):
+    sync_engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=sync_engine)
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    AsyncSessionFactory = sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+    with SyncSession() as db:
+        db.add_all(models.Todo(title=f"Seed todo {i}", urgency=i % 4) for i in range(seed_rows))
+        db.commit()
+
+    deadline = time.perf_counter() + seconds
+    read_latencies: List[float] = []
+    writes = 0
+
+    async def read_once(scheduled: float):
+        if mode == "sync":
+            with SyncSession() as db:
+                crud.get_todos(db)
+        else:
+            async with AsyncSessionFactory() as db:
+                await crud.get_todos_async(db)
+        # Measured from the scheduled arrival so time spent waiting for a
+        # blocked event loop counts against the request.
+        read_latencies.append(time.perf_counter() - scheduled)
+
+    async def reader():
+        # Open-loop arrivals at a fixed rate, like independent clients.
+        in_flight = set()
+        next_arrival = time.perf_counter()
+        while next_arrival < deadline:
+            await asyncio.sleep(max(0.0, next_arrival - time.perf_counter()))
+            task = asyncio.ensure_future(read_once(next_arrival))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            next_arrival += 1.0 / read_rate
+        await asyncio.gather(*in_flight)
+
+    async def writer(worker: int):
+        nonlocal writes
+        while time.perf_counter() < deadline:
+            todo_input = TodoCreateInput(title=f"Write {worker}-{writes}", urgency=2)
+            if mode == "sync":
+                with SyncSession() as db:
+                    crud.create_todo(db, todo_input)
+            else:
+                async with AsyncSessionFactory() as db:
+                    await crud.create_todo_async(db, todo_input)
+            writes += 1
+            await asyncio.sleep(0)
+
+    await asyncio.gather(reader(), *[writer(i) for i in range(writers)])
+    await async_engine.dispose()
+    sync_engine.dispose()
+    return summarize(read_latencies), writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--read-rate", type=float, default=50.0, help="reads per second")
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+
+    for mode in ("sync", "async"):
+        with temp_database_path() as path:
+            stats, writes = asyncio.run(_run(mode, path, args.read_rate, args.writers, args.seconds, args.rows))
+        print(
+            f"{mode:>5}: reads={stats['count']:<6} writes={writes:<5} "
+            f"p50={stats['p50_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms max={stats['max_ms']:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Shared helpers for the benchmark scripts."""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the pct-th percentile of values using nearest-rank."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Summarize a list of latencies (seconds) as milliseconds."""
+    return {
+        "count": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+@contextmanager
+def temp_database_path() -> Iterator[str]:
+    """Yield the path of a throwaway SQLite database file."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "bench.db")
@@ -0,0 +1,90 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import Base, engine
+import pytest
+
+BULK_FIELDS = """
+    todos {
+        id
+        title
+        completed
+        urgency
+    }
+    errors {
+        index
+        id
+        message
+    }
+"""
+
+# Create test database
+@pytest.fixture(scope="module", autouse=True)
+def setup_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+def graphql(client, query, variables):
+    response = client.post("/graphql", json={"query": query, "variables": variables})
+    assert response.status_code == 200
+    data = response.json()
+    assert "errors" not in data
+    return data["data"]
+
+def test_bulk_graphql_round_trip(client):
+    created = graphql(
+        client,
+        "mutation($inputs: [TodoCreateInput!]!) { createTodos(inputs: $inputs) { %s } }" % BULK_FIELDS,
+        {"inputs": [{"title": f"Bulk {i}", "urgency": i % 4} for i in range(5)] + [{"title": "  "}]},
+    )["createTodos"]
+    assert [todo["title"] for todo in created["todos"]] == [f"Bulk {i}" for i in range(5)]
+    assert created["errors"] == [{"index": 5, "id": None, "message": "Title must not be empty"}]
+    ids = [todo["id"] for todo in created["todos"]]
+
+    updated = graphql(
+        client,
+        "mutation($inputs: [TodoBulkUpdateInput!]!) { updateTodos(inputs: $inputs) { %s } }" % BULK_FIELDS,
+        {"inputs": [
+            {"id": ids[0], "completed": True},
+            {"id": ids[1], "title": "Renamed", "urgency": 3},
+            {"id": ids[2], "completed": True},
+            {"id": 999999, "completed": True},
+        ]},
+    )["updateTodos"]
+    by_id = {todo["id"]: todo for todo in updated["todos"]}
+    assert by_id[ids[0]]["completed"] is True
+    assert by_id[ids[1]]["title"] == "Renamed" and by_id[ids[1]]["urgency"] == 3
+    assert by_id[ids[2]]["completed"] is True
+    assert updated["errors"] == [{"index": 3, "id": 999999, "message": "Todo not found"}]
+
+    deleted = graphql(
+        client,
+        "mutation($ids: [Int!]!) { deleteTodos(ids: $ids) { %s } }" % BULK_FIELDS,
+        {"ids": [ids[3], ids[4], 999999]},
+    )["deleteTodos"]
+    assert sorted(todo["id"] for todo in deleted["todos"]) == sorted(ids[3:5])
+    assert deleted["errors"] == [{"index": 2, "id": 999999, "message": "Todo not found"}]
+
+def test_bulk_rest_endpoints(client):
+    response = client.post("/api/todos/batch", json=[{"title": "REST bulk 1"}, {"title": "REST bulk 2", "urgency": 9}])
+    assert response.status_code == 200
+    todos = response.json()["todos"]
+    assert [todo["urgency"] for todo in todos] == [1, 3]
+
+    response = client.patch("/api/todos/batch", json=[{"id": todo["id"], "completed": True} for todo in todos])
+    assert response.status_code == 200
+    assert all(todo["completed"] for todo in response.json()["todos"])
+
+    response = client.post("/api/todos/batch/delete", json={"ids": [todo["id"] for todo in todos]})
+    assert response.status_code == 200
+    assert response.json()["errors"] == []
+    assert client.get(f"/api/todos/{todos[0]['id']}").status_code == 404
+
+def test_bulk_size_limit(client):
+    response = client.post("/api/todos/batch/delete", json={"ids": list(range(501))})
+    assert response.status_code == 400
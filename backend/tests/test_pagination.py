@@ -0,0 +1,90 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from app.main import app
+from app import models
+from app.database import Base, engine
+import pytest
+
+TODOS_PAGE = """
+    query($first: Int!, $after: String, $sort: TodoSort!) {
+        todosConnection(first: $first, after: $after, sort: $sort) {
+            edges {
+                cursor
+                node {
+                    id
+                    title
+                    urgency
+                }
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    }
+"""
+
+# Create test database
+@pytest.fixture(scope="module", autouse=True)
+def setup_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = Session(engine)
+    # Same created_at second for every row, so id has to break the ties
+    db.add_all(models.Todo(title=f"Todo {i}", urgency=i % 4) for i in range(7))
+    db.commit()
+    db.close()
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+def fetch_all_pages(client, sort, first=3):
+    seen, after = [], None
+    while True:
+        response = client.post(
+            "/graphql",
+            json={"query": TODOS_PAGE, "variables": {"first": first, "after": after, "sort": sort}}
+        )
+        assert response.status_code == 200
+        connection = response.json()["data"]["todosConnection"]
+        seen.extend(edge["node"] for edge in connection["edges"])
+        if not connection["pageInfo"]["hasNextPage"]:
+            return seen
+        after = connection["pageInfo"]["endCursor"]
+
+def test_connection_pages_by_created_at(client):
+    todos = fetch_all_pages(client, "CREATED_AT")
+    ids = [todo["id"] for todo in todos]
+    assert len(ids) == 7
+    assert ids == sorted(ids, reverse=True)
+
+def test_connection_pages_by_urgency(client):
+    todos = fetch_all_pages(client, "URGENCY", first=2)
+    keys = [(todo["urgency"], todo["id"]) for todo in todos]
+    assert len(keys) == 7
+    assert keys == sorted(keys, reverse=True)
+
+def test_invalid_cursor(client):
+    response = client.post(
+        "/graphql",
+        json={"query": TODOS_PAGE, "variables": {"first": 2, "after": "not-a-cursor", "sort": "CREATED_AT"}}
+    )
+    assert response.json()["errors"][0]["message"] == "Invalid cursor"
+
+def test_rest_pagination(client):
+    response = client.get("/api/todos/", params={"limit": 4})
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 4
+
+    response = client.get("/api/todos/", params={"limit": 4, "after": response.headers["X-Next-Cursor"]})
+    second_page = response.json()
+    assert len(second_page) == 3
+    assert "X-Next-Cursor" not in response.headers
+    assert {todo["id"] for todo in first_page}.isdisjoint(todo["id"] for todo in second_page)
+
+    response = client.get("/api/todos/", params={"after": "not-a-cursor"})
+    assert response.status_code == 400